@@ -1,15 +1,17 @@
 import asyncio
+import logging
 import time
+
+import aiohttp
 from binance import AsyncClient, BinanceSocketManager
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from typing import Optional
-from cryptography.hazmat.primitives.serialization import load_pem_private_key
 
 
 from publishing.core import FilePubSub, KeyValueStorePubSub, InMemoryWithLogPublisher
 from storage.core import KeyValueStorage, InMemoryKeyValueStorage
 from utils import account_info_workaround
-from utils.config import Config
+from utils.config import Config, get_config
 from utils.logging import setup_logging
 
 
@@ -22,7 +24,7 @@ class BinanceExchangeMetadataPoller:
         self.ed_api_key = config.get_ed25519_api_key()
         self.secret_key_path = config.get_ed25519_secret_path()
         self.polling_interval = config.get_polling_interval()
-        file_pub = FilePubSub(flush_interval=5.0, flush_limit=10)
+        file_pub = FilePubSub(flush_interval=5.0)
         kvs_pub = KeyValueStorePubSub(key_value_storage)
         self.publisher = InMemoryWithLogPublisher(kvs_pub, file_pub)
         self.client = None
@@ -33,11 +35,14 @@ class BinanceExchangeMetadataPoller:
         """
         Initialize the Binance client, load the private key, and set up socket manager.
         """
-        with open(self.secret_key_path, 'rb') as f:
-            self.private_key = load_pem_private_key(data=f.read(), password=None)
+        # Shares the cached key used to sign account info requests, so the PEM is only parsed once per process
+        self.private_key = account_info_workaround.load_private_key()
 
         self.logger.info("Initializing poller...")
-        self.client = await AsyncClient.create(self.api_key, self.api_secret)
+        # One connection pool for every Binance request, including the account info workaround, so that
+        # keep-alive connections (and their TLS handshakes) are shared across all endpoints
+        connector = aiohttp.TCPConnector(limit=50, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60)
+        self.client = await AsyncClient.create(self.api_key, self.api_secret, session_params={'connector': connector})
         self.socket_manager = BinanceSocketManager(self.client)
         await self.start_polling()
 
@@ -48,10 +53,11 @@ class BinanceExchangeMetadataPoller:
 
         http_task = asyncio.create_task(self.poll_http_endpoints())
 
-        await asyncio.gather(http_task)
-
-        await self.client.close_connection()
-        await self.publisher.close()
+        try:
+            await asyncio.gather(http_task)
+        finally:
+            await self.client.close_connection()
+            await self.publisher.close()
 
 
     @staticmethod
@@ -66,21 +72,24 @@ class BinanceExchangeMetadataPoller:
         Poll non-time-sensitive data using HTTP APIs.
         """
         while True:
-            self.logger.debug(f"Polling HTTP endpoints at {time.strftime('%Y-%m-%d %H:%M:%S')}")
-
-            exchange_info = await self.get_exchange_info()
-            if exchange_info:
-                self.publisher.publish(topic='exchange_info', message=exchange_info)
-
-            account_info = self.get_account_info()
-            if account_info:
-                self.publisher.publish(topic='account_info', message=account_info)
-
-            system_status = await self.get_system_status()
-            if system_status:
-                self.publisher.publish(topic='system_status', message=system_status)
-
-            self.logger.debug(f"Sleeping for {self.polling_interval} seconds...")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Polling HTTP endpoints at %s", time.strftime('%Y-%m-%d %H:%M:%S'))
+
+            # These are independent, so fetch them concurrently rather than paying for each round trip in turn
+            results = await asyncio.gather(
+                self.get_exchange_info(),
+                self.get_account_info(),
+                self.get_system_status(),
+                return_exceptions=True,
+            )
+
+            for topic, result in zip(('exchange_info', 'account_info', 'system_status'), results):
+                if isinstance(result, BaseException):
+                    self.logger.error(f"Unexpected error fetching {topic}: {result!r}")
+                elif result:
+                    self.publisher.publish(topic=topic, message=result)
+
+            self.logger.debug("Sleeping for %s seconds...", self.polling_interval)
             await asyncio.sleep(self.polling_interval)
 
     async def get_exchange_info(self) -> Optional[dict]:
@@ -100,22 +109,22 @@ class BinanceExchangeMetadataPoller:
         Fetch exchange metadata for a specific symbol.
         """
         try:
-            self.logger.debug(f'Fetching symbol info for symbol {symbol}')
+            self.logger.debug('Fetching symbol info for symbol %s', symbol)
             exchange_info = await self.client.get_symbol_info(symbol)
             return exchange_info
         except (BinanceAPIException, BinanceRequestException) as e:
             self.logger.error(f"Error fetching symbol info: {e}")
             return None
 
-    def get_account_info(self) -> Optional[dict]:
+    async def get_account_info(self) -> Optional[dict]:
         """
         Fetch account balances and permissions.
         """
         try:
             self.logger.debug('Fetching account info')
-            return account_info_workaround.get_account_info()
+            return await account_info_workaround.get_account_info(self.client.session)
 
-        except (BinanceAPIException, BinanceRequestException) as e:
+        except (BinanceAPIException, BinanceRequestException, aiohttp.ClientError) as e:
             self.logger.error(f"Error fetching account info: {e}")
             return None
 
@@ -135,11 +144,17 @@ async def main():
     """
     Main entry point to run the poller.
     """
-    config = Config()
+    config = get_config()
     kvs = InMemoryKeyValueStorage()
     poller = BinanceExchangeMetadataPoller(config, kvs)
     await poller.initialize()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop isn't available on every platform (e.g. Windows), where the stock event loop does the job
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,15 +1,16 @@
-import json
-from datetime import datetime
-
 import asyncio
 import os
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from abc import ABC, abstractmethod
-from typing import TextIO
+from functools import lru_cache
 
-from publishing.parsing import parse_symbols_info
+from publishing.parsing import parse_symbol_info
 from storage.core import KeyValueStorage
 from utils.logging import setup_logging
+from utils.serialization import dumps
 
 """
 NB: There is a time limit on this assignment, so the publisher abstraction currently serves as both publisher
@@ -17,7 +18,56 @@ NB: There is a time limit on this assignment, so the publisher abstraction curre
  the logic of persisting messages from the poller, and it does that well enough.
 """
 
+def _iov_max() -> int:
+    """
+    The most buffers a single writev call accepts, or -1 if vectored writes aren't available (e.g. on Windows).
+    """
+    if not hasattr(os, 'writev'):
+        return -1
+    try:
+        return os.sysconf('SC_IOV_MAX')
+    except (AttributeError, ValueError, OSError):
+        return -1
+
+_IOV_MAX = _iov_max()
+
+# Windows translates newlines on descriptors opened without O_BINARY, which doesn't exist elsewhere
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+
+@lru_cache(maxsize=2)
+def _format_timestamp(epoch_seconds: int) -> bytes:
+    """
+    Format a log line timestamp. Cached since many messages are published within the same second.
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(epoch_seconds)).encode()
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Write all of data to a file descriptor, retrying on short writes.
+    """
+    remaining = memoryview(data)
+    while remaining:
+        remaining = remaining[os.write(fd, remaining):]
+
+def _write_lines(fd: int, lines: list[bytes]) -> None:
+    """
+    Write all buffered lines to a file descriptor, using as few (vectored) syscalls as possible.
+    """
+    if _IOV_MAX <= 0:
+        # No usable writev (unsupported platform, or the limit is indeterminate), so fall back to one plain write
+        _write_all(fd, b"".join(lines))
+        return
+    for start in range(0, len(lines), _IOV_MAX):
+        batch = lines[start:start + _IOV_MAX]
+        written = os.writev(fd, batch)
+        if written < sum(map(len, batch)):
+            # Short write (e.g. interrupted or disk nearly full), write out the remainder the slow way
+            _write_all(fd, b"".join(batch)[written:])
+
+
 class Publisher(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def publish(self, topic: str, message: dict) -> None:
         """
@@ -32,116 +82,163 @@ class Publisher(ABC):
         pass
 
 class KeyValueStorePubSub(Publisher):
+    __slots__ = ('key_value_store', '_raw_symbols', '_symbol_names')
+
     def __init__(self, key_value_store: KeyValueStorage) -> None:
         """
         Initializes a publisher/subscriber that updates the server's storage of key-value pairs
 
         """
         self.key_value_store = key_value_store
+        # The raw exchangeInfo entry last written for each symbol, used to skip unchanged symbols
+        self._raw_symbols: dict[str, dict] = {}
+        # Names of the symbols currently listed, so the symbol list is only rebuilt when it changes
+        self._symbol_names: set[str] = set()
 
     def publish(self, topic: str, message: dict) -> None:
         """
         Write to the underlying store
         """
         if topic == 'exchange_info':
-            symbols_info = parse_symbols_info(message)
-            for key, value in symbols_info.items():
-                self.key_value_store.write('symbols', key, value)
+            # The vast majority of symbols are unchanged between polls, so only re-parse and write those that changed
+            symbols_changed = False
+            symbol_names = set()
+            for symbol_info in message.get('symbols', ()):
+                symbol = symbol_info['symbol']
+                symbol_names.add(symbol)
+                if self._raw_symbols.get(symbol) == symbol_info:
+                    continue
+                self.key_value_store.write('symbols', symbol, parse_symbol_info(symbol_info))
+                self._raw_symbols[symbol] = symbol_info
+                symbols_changed = True
+            if symbol_names != self._symbol_names:
+                # Drop delisted symbols too, so /symbols/{symbol} agrees with the symbol list
+                for delisted in self._symbol_names - symbol_names:
+                    self.key_value_store.delete('symbols', delisted)
+                    self._raw_symbols.pop(delisted, None)
+                    symbols_changed = True
+                self.key_value_store.write(topic, 'symbols', {'symbols': sorted(symbol_names)})
+                self._symbol_names = symbol_names
+            if symbols_changed:
+                self.key_value_store.commit('symbols')
             self.key_value_store.write(topic, 'rateLimits', message['rateLimits'])
+            self.key_value_store.commit(topic)
         if topic in ['system_status', 'account_info']:
             for key, value in message.items():
                 self.key_value_store.write(topic, key, value)
+            self.key_value_store.commit(topic)
 
     def close(self) -> None:
         pass
 
 
 class FilePubSub(Publisher):
-    def __init__(self, base_dir: str = 'output', flush_interval: float = 1, flush_limit: int = 10_000) -> None:
+    __slots__ = ('base_dir', 'fds', 'buffers', '_io_exec', 'flush_interval', '_dirty', 'flush_task', 'logger')
+
+    def __init__(self, base_dir: str = 'output', flush_interval: float = 1) -> None:
         """
         Initializes a publisher/subscriber that periodically flushes writes for each topic to a file.
         Used to maintain a complete historical record of updates.
 
         Args:
         - base_dir (str): Directory where topic files will be stored
-        - flush_interval (float): Time interval (seconds) between async flushes
-        - flush_limit (int): Max number of messages to buffer before triggering a synchronous flush
+        - flush_interval (float): Time interval (seconds) between async flushes. This is the only flush trigger,
+            so it also bounds how much is buffered in memory
         """
         self.base_dir = base_dir
         os.makedirs(self.base_dir, exist_ok=True)
 
-        self.file_handles: dict[str, TextIO] = {}
-        self.write_counts: dict[str, int] = {}
+        self.fds: dict[str, int] = {}
+        self.buffers: dict[str, list[bytes]] = {}
+        # Writes happen on a dedicated thread so a slow disk doesn't stall the event loop.
+        # A single worker preserves the order of writes to each file.
+        self._io_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='file-pubsub')
 
         self.flush_interval = flush_interval
-        self.flush_limit = flush_limit
 
+        # Set whenever there are buffered writes, so the flush task can sleep while nothing is being published
+        self._dirty = asyncio.Event()
         self.flush_task = asyncio.create_task(self.flush_periodically())
         self.logger = setup_logging(__name__)
 
-    def _get_file_handle(self, topic: str) -> TextIO:
+    def _get_buffer(self, topic: str) -> list[bytes]:
         """
-        Get or create a file handle for the specified topic.
+        Get or create the write buffer (and backing file descriptor) for the specified topic.
         """
-        if topic not in self.file_handles:
+        if topic not in self.buffers:
             file_path = os.path.join(self.base_dir, f"{topic}.log")
-            self.file_handles[topic] = open(file_path, 'a')
-            self.write_counts[topic] = 0
-        return self.file_handles[topic]
+            self.fds[topic] = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | _O_BINARY, 0o644)
+            self.buffers[topic] = []
+        return self.buffers[topic]
 
     def publish(self, topic: str, message: dict) -> None:
         """
-        Buffer a message to the requested topic.
-        Triggers a flush if the total number of buffered writes is too large
+        Buffer a message to the requested topic, to be written out by the next periodic flush.
         """
-        self.logger.info(f'publishing to topic {topic}')
-        file_handle = self._get_file_handle(topic)
-        message_s = json.dumps(message)
-        formatted_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        file_handle.write(f"{formatted_time} - {message_s}\n")
-        self.write_counts[topic] += 1
-
-        # Flush if message count exceeds the limit
-        if self.write_counts[topic] >= self.flush_limit:
-            self.flush(topic)
+        self.logger.debug('publishing to topic %s', topic)
+        buffer = self._get_buffer(topic)
+        buffer.append(b"%s - %s\n" % (_format_timestamp(int(time.time())), dumps(message)))
+        self._dirty.set()
 
     def flush(self, topic: str) -> None:
         """
-        Flush the file for the specified topic.
+        Hand off the buffered writes for the specified topic to the I/O thread.
+        """
+        buffer = self.buffers.get(topic)
+        if buffer:
+            self.buffers[topic] = []
+            future = self._io_exec.submit(_write_lines, self.fds[topic], buffer)
+            future.add_done_callback(self._log_write_error)
+
+    def _log_write_error(self, future: Future) -> None:
+        """
+        Surface failed background writes, which would otherwise be silently dropped with their future.
         """
-        if topic in self.file_handles:
-            self.file_handles[topic].flush()
-            self.write_counts[topic] = 0
+        if future.exception() is not None:
+            self.logger.error(f"Error writing to topic log: {future.exception()}")
 
     async def flush_periodically(self) -> None:
         """
-        Periodically flush all open file handles asynchronously.
+        Periodically flush all topic buffers asynchronously.
+        Waits for a publish before starting each interval, so an idle publisher doesn't wake up at all.
         """
         while True:
+            await self._dirty.wait()
             await asyncio.sleep(self.flush_interval)
+            self._dirty.clear()
             self.flush_all()
 
     def flush_all(self) -> None:
         """
-        Flush all open file handles.
+        Flush all topic buffers.
+        """
+        for topic in self.buffers:
+            self.flush(topic)
+
+    def _close_fds(self) -> None:
+        """
+        Close all open topic files. Must run on the I/O thread.
         """
-        for topic, file_handle in self.file_handles.items():
-            file_handle.flush()
-            self.write_counts[topic] = 0
+        for fd in self.fds.values():
+            os.close(fd)
+        self.fds.clear()
 
     async def close(self) -> None:
         """
-        Close all open file handles and stop the periodic flushing.
+        Flush and close all open files and stop the periodic flushing.
         """
         self.flush_task.cancel()
         await asyncio.gather(self.flush_task, return_exceptions=True)
-        for file_handle in self.file_handles.values():
-            file_handle.close()
-        self.file_handles.clear()
-        self.write_counts.clear()
+        self.flush_all()
+        # Runs after any outstanding writes, since the executor processes jobs in submission order
+        await asyncio.wrap_future(self._io_exec.submit(self._close_fds))
+        self._io_exec.shutdown()
+        self.buffers.clear()
 
 
 class InMemoryWithLogPublisher(Publisher):
+    __slots__ = ('in_memory', 'file_backed')
+
     def __init__(self, in_memory: KeyValueStorePubSub, file_backed: FilePubSub):
         self.in_memory = in_memory
         self.file_backed = file_backed
@@ -154,6 +251,6 @@ class InMemoryWithLogPublisher(Publisher):
         self.file_backed.publish(topic, message)
         self.in_memory.publish(topic, message)
 
-    def close(self) -> None:
+    async def close(self) -> None:
         self.in_memory.close()
-        self.file_backed.close()
\ No newline at end of file
+        await self.file_backed.close()
\ No newline at end of file
@@ -2,50 +2,38 @@ def parse_symbols_info(response: dict) -> dict:
     """
     Parse Binance exchangeInfo response to extract relevant metadata for each symbol.
     """
+    return {symbol_info["symbol"]: parse_symbol_info(symbol_info) for symbol_info in response.get("symbols", ())}
 
-    symbol_metadata = {}
 
-    for symbol_info in response.get("symbols", []):
-        symbol = symbol_info.get("symbol")
-        status = symbol_info.get("status")
-        base_asset = symbol_info.get("baseAsset")
-        quote_asset = symbol_info.get("quoteAsset")
-
-        # Initialize variables for metadata
-        tick_size = None
-        min_price = None
-        max_price = None
-        min_qty = None
-        max_qty = None
-        step_size = None
-
-        # Loop through filters to extract PRICE_FILTER and LOT_SIZE
-        for filter_info in symbol_info.get("filters", []):
-            if filter_info.get("filterType") == "PRICE_FILTER":
-                min_price = filter_info.get("minPrice")
-                max_price = filter_info.get("maxPrice")
-                tick_size = filter_info.get("tickSize")
-            elif filter_info.get("filterType") == "LOT_SIZE":
-                min_qty = filter_info.get("minQty")
-                max_qty = filter_info.get("maxQty")
-                step_size = filter_info.get("stepSize")
-
-        symbol_metadata[symbol] = {
-            "symbol": symbol,
-            "baseAsset": base_asset,
-            "quoteAsset": quote_asset,
-            "tickSize": tick_size,
-            "minPrice": min_price,
-            "maxPrice": max_price,
-            "lotSize": {
-                "minQty": min_qty,
-                "maxQty": max_qty,
-                "stepSize": step_size
-            },
-            "status": status
-        }
+def parse_symbol_info(symbol_info: dict) -> dict:
+    """
+    Extract the relevant metadata for a single symbol entry of a Binance exchangeInfo response.
+    """
+    # Find the PRICE_FILTER and LOT_SIZE filters, stopping as soon as we have both
+    price_filter = lot_size = None
+    for filter_info in symbol_info["filters"]:
+        filter_type = filter_info["filterType"]
+        if filter_type == "PRICE_FILTER":
+            price_filter = filter_info
+        elif filter_type == "LOT_SIZE":
+            lot_size = filter_info
+        if price_filter is not None and lot_size is not None:
+            break
 
-    return symbol_metadata
+    return {
+        "symbol": symbol_info["symbol"],
+        "baseAsset": symbol_info["baseAsset"],
+        "quoteAsset": symbol_info["quoteAsset"],
+        "tickSize": price_filter["tickSize"] if price_filter else None,
+        "minPrice": price_filter["minPrice"] if price_filter else None,
+        "maxPrice": price_filter["maxPrice"] if price_filter else None,
+        "lotSize": {
+            "minQty": lot_size["minQty"] if lot_size else None,
+            "maxQty": lot_size["maxQty"] if lot_size else None,
+            "stepSize": lot_size["stepSize"] if lot_size else None
+        },
+        "status": symbol_info["status"]
+    }
 
 # Example usage with mock response
 # sample_response = {
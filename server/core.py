@@ -1,17 +1,19 @@
 import asyncio
+from typing import Optional
 
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 
 from poller.core import BinanceExchangeMetadataPoller
 from storage.core import KeyValueStorage, InMemoryKeyValueStorage
-from utils.config import Config
+from utils.config import get_config
 
 
 class ExchangeMetadataWebServer:
     def __init__(self, kv_store: KeyValueStorage):
         self.kv_store = kv_store
-        self.app = FastAPI()
+        self.app = FastAPI(default_response_class=ORJSONResponse)
 
 
         @self.app.get("/rate_limits")
@@ -19,19 +21,13 @@ class ExchangeMetadataWebServer:
             """
             Get rate limit info
             """
-            data = self.kv_store.read('exchange_info', 'rateLimits')
-            if data is None:
-                raise HTTPException(status_code=404, detail="No data available")
-            return data
+            return self.json_response(self.kv_store.read_bytes('exchange_info', 'rateLimits'))
         @self.app.get("/symbols")
         async def get_symbols():
             """
             Get a list of symbols active on the exchange
             """
-            all_symbol_data = self.kv_store.read_all('symbols')
-            if all_symbol_data is None:
-                raise HTTPException(status_code=404, detail="No data available")
-            return {"symbols": list(all_symbol_data.keys())}
+            return self.json_response(self.kv_store.read_bytes('exchange_info', 'symbols'))
 
         # Define API routes
         @self.app.get("/symbols/{symbol}")
@@ -39,20 +35,17 @@ class ExchangeMetadataWebServer:
             """
             Get reference information for a specific symbol
             """
-            symbol_data = self.kv_store.read('symbols', symbol)
+            symbol_data = self.kv_store.read_bytes('symbols', symbol)
             if not symbol_data:
                 raise HTTPException(status_code=404, detail="Symbol not found")
-            return symbol_data
+            return Response(content=symbol_data, media_type="application/json")
 
         @self.app.get("/exchange_status")
         async def get_all_exchange_info():
             """
             Get all reference information for all symbols
             """
-            data = self.kv_store.read_all('system_status')
-            if data is None:
-                raise HTTPException(status_code=404, detail="No data available")
-            return data
+            return self.json_response(self.kv_store.read_all_bytes('system_status'))
 
 
         @self.app.get("/account_info")
@@ -60,20 +53,28 @@ class ExchangeMetadataWebServer:
             """
             Get account info
             """
-            data = self.kv_store.read_all('account_info')
-            if data is None:
-                raise HTTPException(status_code=404, detail="No data available")
-            return data
+            return self.json_response(self.kv_store.read_all_bytes('account_info'))
 
 
-    def run(self):
+    @staticmethod
+    def json_response(content: Optional[bytes]) -> Response:
         """
-        Run the FastAPI server
+        Serve already-encoded JSON as-is, skipping FastAPI's encoder.
         """
-        uvicorn.run(self.app, host=Config().get_web_host(), port=Config().get_web_port())
+        if content is None:
+            raise HTTPException(status_code=404, detail="No data available")
+        return Response(content=content, media_type="application/json")
+
+    async def serve(self):
+        """
+        Run the FastAPI server on the current event loop
+        """
+        config = get_config()
+        server_config = uvicorn.Config(self.app, host=config.get_web_host(), port=config.get_web_port(), http="httptools")
+        await uvicorn.Server(server_config).serve()
 
 async def main():
-    config = Config()
+    config = get_config()
 
     kv_store = InMemoryKeyValueStorage()
     # Start the poller to update exchange info every 60 seconds
@@ -83,12 +84,18 @@ async def main():
     # Set up and run the web server
     server = ExchangeMetadataWebServer(kv_store)
 
-    # Run the web server and poller concurrently
+    # Run the web server and poller concurrently on the same loop, so the store is never accessed from two threads
     await asyncio.gather(
         poller_task,
-        asyncio.to_thread(server.run)  # FastAPI needs to run in a thread
+        server.serve()
     )
 
 # Running the server and simulating data polling
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop isn't available on every platform (e.g. Windows), where the stock event loop does the job
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
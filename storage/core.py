@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from typing import Optional, Any
 
+from utils.serialization import dumps
+
+# Shared stand-in for a missing table on the read path, to avoid allocating a new dict per lookup. Never mutated.
+_EMPTY: dict = {}
+
 
 class KeyValueStorage(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def write(self, table: str, key: str, value: Any) -> None:
         """
@@ -24,6 +32,27 @@ class KeyValueStorage(ABC):
         """
         pass
 
+    def read_bytes(self, table: str, key: str) -> Optional[bytes]:
+        """
+        Get the JSON-encoded value associated with a certain key.
+        """
+        value = self.read(table, key)
+        return None if value is None else dumps(value)
+
+    def read_all_bytes(self, table: str) -> Optional[bytes]:
+        """
+        Get all key-value pairs in a specific table, JSON-encoded as a single object.
+        """
+        values = self.read_all(table)
+        return None if values is None else dumps(values)
+
+    def commit(self, table: str) -> None:
+        """
+        Make all writes to a table since the last commit visible to readers.
+        Storage without staged writes can leave this as a no-op.
+        """
+        pass
+
     @abstractmethod
     def delete(self, table: str, key: str) -> None:
         """
@@ -40,31 +69,62 @@ class KeyValueStorage(ABC):
 
 
 class InMemoryKeyValueStorage(KeyValueStorage):
+    __slots__ = ('storage', '_snapshots', 'serialized', '_serialized_snapshots', '_table_blobs')
+
     def __init__(self):
         # Dictionary to hold tables, each table is itself a dictionary for key-value pairs
-        self.storage = {}
+        self.storage = defaultdict(dict)
+        # The committed copy of each table that readers see. Snapshots are replaced wholesale and never mutated,
+        # so readers can iterate them while the writer is updating self.storage
+        self._snapshots = {}
+        # JSON encodings of every value, computed once at write time so that reads don't re-encode them
+        self.serialized = defaultdict(dict)
+        self._serialized_snapshots = {}
+        # Lazily built encoding of each committed table as a whole, dropped whenever the table is committed
+        self._table_blobs = {}
 
     def write(self, table: str, key: str, value: Any) -> None:
-        if table not in self.storage:
-            self.storage[table] = {}
         self.storage[table][key] = value
+        self.serialized[table][key] = dumps(value)
+
+    def commit(self, table: str) -> None:
+        if table in self.storage:
+            self._snapshots[table] = self.storage[table].copy()
+            self._serialized_snapshots[table] = self.serialized[table].copy()
+            self._table_blobs.pop(table, None)
 
     def read(self, table: str, key: str) -> Optional[Any]:
-        return self.storage.get(table, {}).get(key, None)
+        return self._snapshots.get(table, _EMPTY).get(key)
+
+    def read_bytes(self, table: str, key: str) -> Optional[bytes]:
+        return self._serialized_snapshots.get(table, _EMPTY).get(key)
+
+    def read_all_bytes(self, table: str) -> Optional[bytes]:
+        blob = self._table_blobs.get(table)
+        if blob is None:
+            serialized = self._serialized_snapshots.get(table)
+            if serialized is None:
+                return None
+            # JSON object keys must be strings, so quote non-string keys rather than emitting them bare
+            blob = b"{%s}" % b",".join(dumps(str(key)) + b":" + value for key, value in serialized.items())
+            self._table_blobs[table] = blob
+        return blob
 
     def delete(self, table: str, key: str) -> None:
         if table in self.storage and key in self.storage[table]:
             del self.storage[table][key]
+            del self.serialized[table][key]
 
     def clear_table(self, table: str) -> None:
         if table in self.storage:
             self.storage[table].clear()
+            self.serialized[table].clear()
 
     def read_all(self, table: str) -> Optional[dict]:
         """
-        Read all key-value pairs in a specific table.
+        Read all key-value pairs in a specific table, as of its last commit.
         """
-        return self.storage.get(table, None)
+        return self._snapshots.get(table, None)
 
 # Example usage:
 if __name__ == "__main__":
@@ -73,14 +133,17 @@ if __name__ == "__main__":
     # Write to the store
     kv_store.write('polling_results', 'BTCUSDT', {'price': '50000', 'volume': '1000'})
     kv_store.write('polling_results', 'ETHUSDT', {'price': '4000', 'volume': '2000'})
+    kv_store.commit('polling_results')
 
     # Read a value
     print(kv_store.read('polling_results', 'BTCUSDT'))  # Output: {'price': '50000', 'volume': '1000'}
 
     # Delete a value
     kv_store.delete('polling_results', 'ETHUSDT')
+    kv_store.commit('polling_results')
     print(kv_store.read('polling_results', 'ETHUSDT'))  # Output: None
 
     # Clear a table
     kv_store.clear_table('polling_results')
+    kv_store.commit('polling_results')
     print(kv_store.read_all('polling_results'))  # Output: None
@@ -1,17 +1,23 @@
+import asyncio
+import functools
 import logging
 import time
-import requests
 import base64
+from typing import Optional
+
+import aiohttp
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from cryptography.hazmat.primitives import serialization
 
-from utils.config import Config
+from utils.config import get_config
 
 BINANCE_API_URL = "https://testnet.binance.vision/"
 ENDPOINT = "/api/v3/account"
-config = Config()
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+config = get_config()
 
-# Load the Ed25519 private key from a PEM file
+# Load the Ed25519 private key from a PEM file. The key doesn't change at runtime, so only parse it once.
+@functools.lru_cache(maxsize=1)
 def load_private_key() -> Ed25519PrivateKey:
     with open(config.get_ed25519_secret_path(), 'rb') as key_file:
         private_key = serialization.load_pem_private_key(key_file.read(), password=None)
@@ -22,8 +28,9 @@ def create_signature(private_key: Ed25519PrivateKey, message: str) -> str:
     signature = private_key.sign(message.encode('utf-8'))
     return base64.b64encode(signature).decode('utf-8')
 
-# Make a signed request to the Binance API using Ed25519 keys
-def get_account_info() -> dict:
+# Make a signed request to the Binance API using Ed25519 keys.
+# Takes the caller's session so the request can reuse its pooled keep-alive connections.
+async def get_account_info(session: aiohttp.ClientSession) -> Optional[dict]:
     # Load the private key
     private_key = load_private_key()
 
@@ -43,16 +50,19 @@ def get_account_info() -> dict:
     url = f"{BINANCE_API_URL}{ENDPOINT}?{query_string}&signature={signature}"
 
     # Send the GET request
-    response = requests.get(url, headers=headers)
-
-    # Handle the response
-    if response.status_code == 200:
-        logging.debug("Account Information:", response.json())
-        resp_info = response.json()
-        return resp_info
-    else:
-        print(f"Error: {response.status_code}, {response.text}")
+    async with session.get(url, headers=headers, timeout=REQUEST_TIMEOUT) as response:
+        # Handle the response
+        if response.status == 200:
+            resp_info = await response.json()
+            logging.debug("Account Information: %s", resp_info)
+            return resp_info
+        else:
+            logging.error("Error fetching account info: %s, %s", response.status, await response.text())
+            return None
 
 # Example usage
 if __name__ == "__main__":
-    get_account_info()
+    async def _example():
+        async with aiohttp.ClientSession() as session:
+            await get_account_info(session)
+    asyncio.run(_example())
@@ -1,7 +1,10 @@
 import tomllib
+from functools import lru_cache
 from typing import List
 
 class Config:
+    __slots__ = ('config',)
+
     def __init__(self, config_file: str = 'config.toml') -> None:
         # Load the config file
         with open(config_file, 'rb') as f:
@@ -44,9 +47,14 @@ class Config:
         """Returns a host for configuring the web server."""
         return self.config['web-server'].get('port', 8000)
 
+@lru_cache(maxsize=1)
+def get_config(config_file: str = 'config.toml') -> Config:
+    """Returns the process-wide Config, so the config file is only read and parsed once."""
+    return Config(config_file)
+
 # Example of how to use the Config class:
 if __name__ == "__main__":
-    config = Config()
+    config = get_config()
     print("API Key:", config.get_api_key())
     print("API Secret:", config.get_api_secret())
     print("Polling Interval:", config.get_polling_interval())
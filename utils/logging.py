@@ -1,11 +1,12 @@
 import logging
 
-from utils.config import Config
+from utils.config import get_config
 
 def setup_logging(name: str):
-    # Set up basic logging configuration
-    logging.basicConfig(
-        level=Config().get_log_level(),  # This sets the log level to DEBUG
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log message format
-    )
+    # Set up basic logging configuration, unless a previous call already did
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=get_config().get_log_level(),  # This sets the log level to DEBUG
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log message format
+        )
     return logging.getLogger(name)
@@ -0,0 +1,12 @@
+from functools import partial
+
+import orjson
+
+# Options for the JSON written to the log files and pre-serialized in the store, which the web API serves as-is.
+# (Anything FastAPI encodes itself, such as error responses, uses its own response class's options instead.)
+# Datetimes are rendered in UTC with a 'Z' suffix, and non-string keys of nested dicts are allowed and stringified.
+# (The store assembles each table's top-level object itself, and stringifies those keys with str().)
+JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+# Encode a value as JSON bytes. A partial rather than a wrapper function, to keep the hot path free of Python frames.
+dumps = partial(orjson.dumps, option=JSON_OPTIONS)